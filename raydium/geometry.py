@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import numpy as np
 from numpy import math
 from raydium.linalg import Vec3
@@ -46,3 +48,47 @@ class Sphere:
             if t > 0.00001:
                 return t
         return 1e9
+
+    def intersect(self, origin: Vec3, direction: Vec3) -> Tuple[float, 'Sphere']:
+        """Calculates the distance to the sphere surface from an incoming ray, along with the sphere that was hit."""
+        return self.hit(origin, direction), self
+
+
+class SphereGroup:
+    """
+    A compound object made up of a parent sphere and child objects enclosed entirely within it.
+
+    Child objects are only tested for intersection once a ray hits the parent, so rays that miss the parent
+    (e.g. a glass sphere) skip the tests for all of its children (e.g. the bubbles inside it).
+    """
+    def __init__(self, parent: Sphere, children: list):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        parent: Sphere
+            bounding sphere, rendered as a regular object in its own right
+        children: list
+            objects (spheres or sphere groups) lying entirely within the parent sphere
+        """
+        self.parent = parent
+        self.children = children
+
+    def hit(self, origin: Vec3, direction: Vec3) -> float:
+        """Calculates the distance between origin and the nearest surface in the group from an incoming ray."""
+        t, _ = self.intersect(origin, direction)
+        return t
+
+    def intersect(self, origin: Vec3, direction: Vec3) -> Tuple[float, Sphere]:
+        """Calculates the distance to the nearest surface in the group from an incoming ray, and the sphere hit."""
+        t_min = self.parent.hit(origin, direction)
+        obj_min = self.parent
+        if t_min >= 1e9:
+            return t_min, obj_min
+        for child in self.children:
+            t, obj = child.intersect(origin, direction)
+            if t < t_min:
+                t_min = t
+                obj_min = obj
+        return t_min, obj_min
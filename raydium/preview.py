@@ -0,0 +1,109 @@
+from threading import Event, RLock, Thread
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from numpy import math
+
+from raydium.io import Image
+from raydium.scenery import Scene
+from raydium.raytracer import render_scene
+
+
+#   Preview passes as (downscale factor, samples per pixel, max ray bounces), rendered in order before the final
+#   full quality pass. The first pass is deliberately tiny so the first image appears in well under a second.
+DEFAULT_PREVIEW_PASSES = [
+    (16, 1, 4),
+    (8, 1, 4),
+    (4, 1, 8),
+    (2, 1, 8),
+]
+
+UpdateFunction = Callable[[Image, int], None]
+
+
+def upscale_image(img: Image, width: int, height: int) -> Image:
+    """Scale a low resolution image up to the specified size (nearest neighbour)."""
+    scale_y = math.ceil(height / img.shape[0])
+    scale_x = math.ceil(width / img.shape[1])
+    img = np.repeat(np.repeat(img, scale_y, axis=0), scale_x, axis=1)
+    return img[:height, :width, :]
+
+
+class PreviewRenderer:
+    """
+    Progressively renders a scene in a background thread, starting with a fast low resolution preview
+    and refining it over successive passes until the image is rendered at full quality.
+    """
+    def __init__(self, scene: Scene, width: int, height: int, on_update: UpdateFunction, num_samples: int = 2,
+                 max_bounces: int = 30, passes: Optional[List[Tuple[int, int, int]]] = None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        scene: Scene
+            container of all object in the scene being rendered
+        width: int
+            final image width
+        height: int
+            final image height
+        on_update: callable
+            a callable taking the image (scaled up to full size) and pass number, called after each pass completes
+        num_samples: int
+            number of samples to calculate per pixel for the final pass
+        max_bounces: int
+            maximum number of ray bounces per pixel for the final pass
+        passes: list
+            (optional) preview passes as (downscale factor, samples, max bounces) tuples rendered before the
+            final pass (defaults to DEFAULT_PREVIEW_PASSES)
+        """
+        self.scene = scene
+        self.width = width
+        self.height = height
+        self.on_update = on_update
+        self.num_samples = num_samples
+        self.max_bounces = max_bounces
+        self.passes = DEFAULT_PREVIEW_PASSES if passes is None else passes
+        self._lock = RLock()
+        self._cancel = Event()
+        self._thread = None
+
+    def start(self, scene: Optional[Scene] = None) -> None:
+        """
+        Start rendering in the background, cancelling any render already in progress.
+
+        Call this again with the edited scene whenever it changes to restart from the first preview pass.
+        """
+        with self._lock:
+            self._cancel.set()
+            if scene is not None:
+                self.scene = scene
+            self._cancel = Event()
+            self._thread = Thread(target=self._render, args=(self.scene, self._cancel), daemon=True)
+            self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop the render in progress (no further updates are made)."""
+        with self._lock:
+            self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the render in progress to finish. Returns True if it is no longer running."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def _render(self, scene: Scene, cancel: Event) -> None:
+        """Render each pass in turn, passing results to the update callback until cancelled."""
+        passes = list(self.passes) + [(1, self.num_samples, self.max_bounces)]
+        for pass_number, (factor, num_samples, max_bounces) in enumerate(passes):
+            width = max(1, math.ceil(self.width / factor))
+            height = max(1, math.ceil(self.height / factor))
+            image = render_scene(scene, width, height, num_samples=num_samples, max_bounces=max_bounces,
+                                 cancel=cancel, verbose=False)
+            with self._lock:
+                if cancel.is_set():
+                    return
+                self.on_update(upscale_image(image, self.width, self.height), pass_number)
@@ -1,3 +1,6 @@
+from threading import Event
+from typing import Optional
+
 import numpy as np
 from numpy import math
 from numpy import random
@@ -69,6 +72,13 @@ def random_on_sphere(centre: Vec3, radius: float) -> Vec3:
     return centre + vec3(x, y, z)
 
 
+def medium_refractive_index(media: list) -> float:
+    """Returns the refractive index of the innermost medium a ray is travelling through (air if none)."""
+    if media:
+        return media[-1].refractive_index
+    return 1.0
+
+
 def trace_ray(origin: Vec3, direction: Vec3, scene: Scene, max_bounces: int = 30) -> Vec3:
     """
     Performs a path trace of an individual ray to determine the color of a scene pixel.
@@ -91,11 +101,13 @@ def trace_ray(origin: Vec3, direction: Vec3, scene: Scene, max_bounces: int = 30
     multiplier = vec3(1.0, 1.0, 1.0)
     color = multiplier * scene.background_color(direction)
 
+    #   Stack of refractive objects the ray is currently inside (innermost last), starting out in air.
+    media = []
+
     bounces = 0
     while bounces < max_bounces:
         bounces += 1
-        hit, t, i = scene.hit_object(origin, direction)
-        obj = scene.objects[i]
+        hit, t, obj = scene.hit_object(origin, direction)
         if hit:
             if not_zero(obj.emitted_color):
                 color = multiplier * obj.emitted_color
@@ -109,9 +121,11 @@ def trace_ray(origin: Vec3, direction: Vec3, scene: Scene, max_bounces: int = 30
             elif obj.refractive_index > 1.0:
                 cos_incident = np.dot(direction, surface_normal)
                 if cos_incident < 0.0:
-                    ni, nt = 1.0, obj.refractive_index
+                    transmitted_media = media + [obj]
+                    ni, nt = medium_refractive_index(media), obj.refractive_index
                 else:
-                    ni, nt = obj.refractive_index, 1.0
+                    transmitted_media = [m for m in media if m is not obj]
+                    ni, nt = obj.refractive_index, medium_refractive_index(transmitted_media)
                     surface_normal = -surface_normal
                 can_refract, refracted_direction = refract(direction, surface_normal, ni, nt)
                 if can_refract:
@@ -123,6 +137,7 @@ def trace_ray(origin: Vec3, direction: Vec3, scene: Scene, max_bounces: int = 30
                         direction = reflect(direction, surface_normal)
                     else:
                         direction = refracted_direction
+                        media = transmitted_media
                 else:
                     direction = reflect(direction, surface_normal)
             else:
@@ -135,7 +150,8 @@ def trace_ray(origin: Vec3, direction: Vec3, scene: Scene, max_bounces: int = 30
     return color
 
 
-def render_scene(scene: Scene, width: int, height: int, num_samples: int = 2, max_bounces: int = 30) -> Image:
+def render_scene(scene: Scene, width: int, height: int, num_samples: int = 2, max_bounces: int = 30,
+                 cancel: Optional[Event] = None, verbose: bool = True) -> Optional[Image]:
     """
     Render an image of a scene with ray tracing.
 
@@ -151,17 +167,23 @@ def render_scene(scene: Scene, width: int, height: int, num_samples: int = 2, ma
         number of samples to calculate per pixel
     max_bounces: int
         maximum number of ray bounces per pixel
+    cancel: Event
+        (optional) when set, rendering stops at the next pixel and None is returned
+    verbose: bool
+        print row progress while rendering
     Returns
     -------
-    Image: an image of the rendered scene
+    Image: an image of the rendered scene (None if rendering was cancelled)
     """
     image = np.random.random(size=(height, width, 3))
     aspect_ratio = height / width
     depth = 2.0
     for row in range(height):
-        if row % 50 == 0:
+        if verbose and row % 50 == 0:
             print(row)
         for column in range(width):
+            if cancel is not None and cancel.is_set():
+                return None
             accumulator = vec3(0.0, 0.0, 0.0)
             for sample in range(num_samples):
                 origin = vec3(0.0, 0.0, 0.0)
@@ -171,6 +193,7 @@ def render_scene(scene: Scene, width: int, height: int, num_samples: int = 2, ma
                 pixel_color = trace_ray(origin, direction, scene, max_bounces)
                 accumulator += pixel_color
             image[height-row - 1, column, :] = accumulator / num_samples
-    print(height)
+    if verbose:
+        print(height)
 
     return image
@@ -1,5 +1,6 @@
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
+from raydium.geometry import Sphere
 from raydium.linalg import Vec3, vec3
 
 
@@ -24,14 +25,14 @@ class Scene:
         Parameters
         ----------
         objects: list
-            collection of scene objects
+            collection of scene objects (spheres or sphere groups)
         background_color_func: callable
             a callable taking a direction vector returning the background pixel color
         """
         self.objects = objects
         self.background_color = background_color_func
 
-    def hit_object(self, origin: Vec3, direction: Vec3) -> Tuple[bool, float, int]:
+    def hit_object(self, origin: Vec3, direction: Vec3) -> Tuple[bool, float, Optional[Sphere]]:
         """
         Checks to see if a tracing ray hits an object.
 
@@ -44,15 +45,15 @@ class Scene:
 
         Returns
         -------
-        tuple: (hit, t, object)
+        tuple: (hit, t, sphere) where sphere is the surface hit (None if nothing was hit)
         """
         t_min = 9e8
-        i_min = -1
+        obj_min = None
         hit = False
-        for idx, obj in enumerate(self.objects):
-            t = obj.hit(origin, direction)
+        for obj in self.objects:
+            t, surface = obj.intersect(origin, direction)
             if 1e-4 <= t < t_min:
                 t_min = t
-                i_min = idx
+                obj_min = surface
                 hit = True
-        return hit, t_min, i_min
+        return hit, t_min, obj_min
@@ -9,10 +9,11 @@ from numpy import math
 from numpy import random
 
 from raydium.io import show_image, save_image
-from raydium.geometry import Sphere
+from raydium.geometry import Sphere, SphereGroup
 from raydium.linalg import vec3, Vec3
 from raydium.scenery import Scene, blue_blend_background_color
 from raydium.raytracer import render_scene
+from raydium.preview import PreviewRenderer
 
 
 def random_in_sphere(centre: Vec3, radius: float) -> Vec3:
@@ -34,6 +35,20 @@ def generate_glass_spheres(seed=None):
 
     glass_sphere_centre = vec3(1.0, 0.0, -5.0)
 
+    #   Bubbles of air inside the glass sphere.
+    bubbles = []
+    num_small_spheres = 10
+    small_radius = 0.3 * math.pow(1.0 / num_small_spheres, 0.333)
+    for sphere in range(num_small_spheres):
+        bubbles.append(Sphere(
+            radius=small_radius,
+            centre=random_in_sphere(glass_sphere_centre, 1.0 - 1.1 * small_radius),
+            emitted_color=vec3(0.0, 0.0, 0.0),
+            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
+            specular_reflectivity=vec3(0.0, 0.0, 0.0),
+            refractive_index=1.0003
+        ))
+
     spheres = [
         #   Light emitting sphere.
         Sphere(
@@ -45,35 +60,26 @@ def generate_glass_spheres(seed=None):
             refractive_index=1.0
         ),
 
-        #   Glass sphere (with a refractive component).
-        Sphere(
-            radius=1.0,
-            centre=glass_sphere_centre,
-            emitted_color=vec3(0.0, 0.0, 0.0),
-            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
-            specular_reflectivity=vec3(0.0, 0.0, 0.0),
-            refractive_index=1.5
+        #   Glass sphere (with a refractive component) containing the bubbles.
+        SphereGroup(
+            parent=Sphere(
+                radius=1.0,
+                centre=glass_sphere_centre,
+                emitted_color=vec3(0.0, 0.0, 0.0),
+                diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
+                specular_reflectivity=vec3(0.0, 0.0, 0.0),
+                refractive_index=1.5
+            ),
+            children=bubbles
         ),
     ]
 
-    #   Add bubbles (invert radius and associated surface normals).
-    num_small_spheres = 10
-    small_radius = 0.3 * math.pow(1.0 / num_small_spheres, 0.333)
-    for sphere in range(num_small_spheres):
-        spheres.append(Sphere(
-            radius=-small_radius,
-            centre=random_in_sphere(glass_sphere_centre, 1.0 - 1.1 * small_radius),
-            emitted_color=vec3(0.0, 0.0, 0.0),
-            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
-            specular_reflectivity=vec3(0.0, 0.0, 0.0),
-            refractive_index=1.5
-        ))
-
     return spheres
 
 
 def main():
     display = False
+    preview = False
     # now = time.time()
     # seed = int(now)
     seed = 1618611775
@@ -95,6 +101,19 @@ def main():
           f'max bounces: {max_bounces}, seed: {seed!r})')
 
     scene = Scene(objects=generate_glass_spheres(seed), background_color_func=blue_blend_background_color)
+
+    if preview:
+        #   Progressively refine the image from a fast low resolution preview, overwriting it after each pass.
+        def update(img, pass_number):
+            print(f'pass {pass_number}: saving image to {filename}')
+            save_image(img, filename)
+
+        renderer = PreviewRenderer(scene, width, height, on_update=update, num_samples=samples,
+                                   max_bounces=max_bounces)
+        renderer.start()
+        renderer.wait()
+        return
+
     image = render_scene(scene, width, height, num_samples=samples, max_bounces=max_bounces)
 
     if display:
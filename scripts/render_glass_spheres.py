@@ -4,10 +4,11 @@ Renders solid and hollow glass spheres.
 import os
 
 from raydium.io import show_image, save_image
-from raydium.geometry import Sphere
+from raydium.geometry import Sphere, SphereGroup
 from raydium.linalg import vec3
 from raydium.scenery import Scene, blue_blend_background_color
 from raydium.raytracer import render_scene
+from raydium.preview import PreviewRenderer
 
 
 def generate_objects():
@@ -34,24 +35,26 @@ def generate_objects():
             refractive_index=1.0
         ),
 
-        #   Glass sphere (with a refractive component).
-        Sphere(
-            radius=1.0,
-            centre=vec3(1.0, 1.0, -7.0),
-            emitted_color=vec3(0.0, 0.0, 0.0),
-            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
-            specular_reflectivity=vec3(0.7, 0.6, 0.5),
-            refractive_index=1.5
-        ),
-
-        #   Sphere inside the glass sphere to "hollow" it out (note inverted radius to switch direction of normals).
-        Sphere(
-            radius=-0.95,
-            centre=vec3(1.0, 1.0, -7.0),
-            emitted_color=vec3(0.0, 0.0, 0.0),
-            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
-            specular_reflectivity=vec3(0.7, 0.6, 0.5),
-            refractive_index=1.5
+        #   Glass sphere (with a refractive component) "hollowed" out by a sphere of air inside it.
+        SphereGroup(
+            parent=Sphere(
+                radius=1.0,
+                centre=vec3(1.0, 1.0, -7.0),
+                emitted_color=vec3(0.0, 0.0, 0.0),
+                diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
+                specular_reflectivity=vec3(0.7, 0.6, 0.5),
+                refractive_index=1.5
+            ),
+            children=[
+                Sphere(
+                    radius=0.95,
+                    centre=vec3(1.0, 1.0, -7.0),
+                    emitted_color=vec3(0.0, 0.0, 0.0),
+                    diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
+                    specular_reflectivity=vec3(0.7, 0.6, 0.5),
+                    refractive_index=1.0003
+                ),
+            ]
         ),
 
         #   Smaller glass sphere (solid).
@@ -80,6 +83,7 @@ def generate_objects():
 
 def main():
     display = False
+    preview = False
 
     pwd = os.path.dirname(__file__)
     image_path = os.path.abspath(os.path.join(pwd, '..', 'images'))
@@ -97,6 +101,19 @@ def main():
     print(f'generating image (resolution: {resolution}, samples per pixel: {samples}, max bounces: {max_bounces})')
 
     scene = Scene(objects=generate_objects(), background_color_func=blue_blend_background_color)
+
+    if preview:
+        #   Progressively refine the image from a fast low resolution preview, overwriting it after each pass.
+        def update(img, pass_number):
+            print(f'pass {pass_number}: saving image to {filename}')
+            save_image(img, filename)
+
+        renderer = PreviewRenderer(scene, width, height, on_update=update, num_samples=samples,
+                                   max_bounces=max_bounces)
+        renderer.start()
+        renderer.wait()
+        return
+
     image = render_scene(scene, width, height, num_samples=samples, max_bounces=max_bounces)
 
     if display:
@@ -9,10 +9,11 @@ import time
 from numpy import random
 
 from raydium.io import show_image, save_image
-from raydium.geometry import Sphere
+from raydium.geometry import Sphere, SphereGroup
 from raydium.linalg import vec3
 from raydium.scenery import Scene, blue_blend_background_color
 from raydium.raytracer import render_scene
+from raydium.preview import PreviewRenderer
 
 
 def generate_random_spheres(seed=None):
@@ -77,22 +78,26 @@ def generate_random_spheres(seed=None):
         radius = random.uniform(0.2, 0.7)
         center = vec3(random.uniform(-4.0, 4.0), -1.0 + radius, random.uniform(-2.0, -10.0))
 
-        spheres.append(Sphere(
-            radius=radius,
-            centre=center,
-            emitted_color=vec3(0.0, 0.0, 0.0),
-            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
-            specular_reflectivity=vec3(0.0, 0.0, 0.0),
-            refractive_index=1.5
-        ))
-
-        spheres.append(Sphere(
-            radius=-0.9 * radius,
-            centre=center,
-            emitted_color=vec3(0.0, 0.0, 0.0),
-            diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
-            specular_reflectivity=vec3(0.0, 0.0, 0.0),
-            refractive_index=1.5
+        #   Hollow glass sphere (an air pocket inside a glass sphere).
+        spheres.append(SphereGroup(
+            parent=Sphere(
+                radius=radius,
+                centre=center,
+                emitted_color=vec3(0.0, 0.0, 0.0),
+                diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
+                specular_reflectivity=vec3(0.0, 0.0, 0.0),
+                refractive_index=1.5
+            ),
+            children=[
+                Sphere(
+                    radius=0.9 * radius,
+                    centre=center,
+                    emitted_color=vec3(0.0, 0.0, 0.0),
+                    diffuse_reflectivity=vec3(0.0, 0.0, 0.0),
+                    specular_reflectivity=vec3(0.0, 0.0, 0.0),
+                    refractive_index=1.0003
+                ),
+            ]
         ))
 
     return spheres
@@ -100,6 +105,7 @@ def generate_random_spheres(seed=None):
 
 def main():
     display = False
+    preview = False
     now = time.time()
     # now = time.time()
     # seed = int(now)
@@ -123,6 +129,19 @@ def main():
           f'max ray bounces: {max_bounces}, seed: {seed!r})')
 
     scene = Scene(objects=generate_random_spheres(seed), background_color_func=blue_blend_background_color)
+
+    if preview:
+        #   Progressively refine the image from a fast low resolution preview, overwriting it after each pass.
+        def update(img, pass_number):
+            print(f'pass {pass_number}: saving image to {filename}')
+            save_image(img, filename)
+
+        renderer = PreviewRenderer(scene, width, height, on_update=update, num_samples=samples,
+                                   max_bounces=max_bounces)
+        renderer.start()
+        renderer.wait()
+        return
+
     image = render_scene(scene, width, height, num_samples=samples, max_bounces=max_bounces)
 
     if display: